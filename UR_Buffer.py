@@ -28,126 +28,159 @@ per second"""
 # SOFTWARE.
 
 
+import math
 import socket
 import time
 
+#: The format for a 6 member pose, applied in a single formatting pass
+POSE_FMT = '[%.6f,%.6f,%.6f,%.6f,%.6f,%.6f]'
+
 
 def deg_2_rad(x):
-    return 3.14 * x / 180
+    return math.radians(x)
 
 
 def rad_2_deg(x):
-    return (x / 3.14) * 180
+    return math.degrees(x)
+
+
+class RateLimiter(object):
+    """Keeps commands at least min_interval seconds apart.
+
+    Only the time remaining until the next command is allowed is slept, so
+    time spent building and sending commands is accounted for.
+    """
+
+    def __init__(self, min_interval):
+        self.next = time.time()
+        self.dt = min_interval
+
+    def wait(self):
+        now = time.time()
+        remaining = self.next - now
+        if remaining > 0:
+            time.sleep(remaining)
+        self.next = max(self.next + self.dt, now + self.dt)
 
 
 def double_range(start, stop, step):
+    i = 0
     r = start
     while r < stop:
         yield r
-        r += step
+        i += 1
+        r = start + i * step
 
 def main():
     HOST = "192.168.1.100"    # The remote host
     PORT = 30003              # The same port as used by the server
 
+    # One connection carries the setup commands and all of the moves
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     s.connect((HOST, PORT))
-    s.send("set_payload(0.0)" + "\n")
-    s.close()
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.connect((HOST, PORT))
-    s.send("set_gravity([0.0, 0.0, 9.82])" + "\n")
-    s.close()
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.connect((HOST, PORT))
+    # Moves are streamed at 125 Hz, so do not let Nagle hold them back
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    s.sendall("set_payload(0.0)" + "\n" +
+              "set_gravity([0.0, 0.0, 9.82])" + "\n")
+    # The controller cannot take more than 125 commands per second
+    rate_limiter = RateLimiter(1.0 / 125)
 
     center = [100.0/1000, -475.0/1000, 425.0/1000, 1.2, -1.2, 1.2]
     angleStart = [90, -95, 90, 0, 90, 90]
     angleStart = map(deg_2_rad, angleStart)
     blend = .005
+    # The acceleration, velocity, and blend do not change between moves
+    fast_suffix = ", a=1.3, v=.3, r=" + str(blend) + ")\n"
+    slow_suffix = ", a=.2, v=.1, r=" + str(blend) + ")\n"
+
+    # Each pose is formatted as soon as it is set, so one list is reused and
+    # only the x and z members are changed for each move
+    thisMove = list(center)
 
+    rate_limiter.wait()
     s.send(
-        "movej("+str(angleStart)+", a=1.3962634015954636, v=1.0471975511965976)" +
-        "\n")
+        "movej(" + POSE_FMT % tuple(angleStart) +
+        ", a=1.3962634015954636, v=1.0471975511965976)" + "\n")
     time.sleep(3)
 
     for delayTime in double_range(0, 2, .25):
-        thisMove = list(center)
         thisMove[0] = center[0] - .1
         thisMove[2] = center[2] - .1
-        command = "movep(p"+str(thisMove)+", a=1.3, v=.3, r="+str(blend)+")" + "\n"
+        command = "movep(p" + POSE_FMT % tuple(thisMove) + fast_suffix
         print command
+        rate_limiter.wait()
         s.send(command)
 
         time.sleep(2)
 
-        thisMove = list(center)
         thisMove[0] = center[0] + .1
         thisMove[2] = center[2] - .1
-        command = "movep(p"+str(thisMove)+", a=.2, v=.1, r="+str(blend)+")" + "\n"
+        command = "movep(p" + POSE_FMT % tuple(thisMove) + slow_suffix
         print command
+        rate_limiter.wait()
         s.send(command)
 
         time.sleep(delayTime)
 
-        thisMove = list(center)
         thisMove[0] = center[0] + .1
         thisMove[2] = center[2] + .1
-        command = "movep(p"+str(thisMove)+", a=.2, v=.1, r="+str(blend)+")" + "\n"
+        command = "movep(p" + POSE_FMT % tuple(thisMove) + slow_suffix
         print command
+        rate_limiter.wait()
         s.send(command)
 
         time.sleep(3)
 
     for delayTime in double_range(0, 2, .25):
-        thisMove = list(center)
         thisMove[0] = center[0] - .1
         thisMove[2] = center[2] - .1
-        command = "movel(p"+str(thisMove)+", a=1.3, v=.3, r="+str(blend)+")" + "\n"
+        command = "movel(p" + POSE_FMT % tuple(thisMove) + fast_suffix
         print command
+        rate_limiter.wait()
         s.send(command)
 
         time.sleep(2)
 
-        thisMove = list(center)
         thisMove[0] = center[0] + .1
         thisMove[2] = center[2] - .1
-        command = "movel(p"+str(thisMove)+", a=.2, v=.1, r="+str(blend)+")" + "\n"
+        command = "movel(p" + POSE_FMT % tuple(thisMove) + slow_suffix
         print command
+        rate_limiter.wait()
         s.send(command)
 
         time.sleep(delayTime)
 
-        thisMove = list(center)
         thisMove[0] = center[0] + .1
         thisMove[2] = center[2] + .1
-        command = "movel(p"+str(thisMove)+", a=.2, v=.1, r="+str(blend)+")" + "\n"
+        command = "movel(p" + POSE_FMT % tuple(thisMove) + slow_suffix
         print command
+        rate_limiter.wait()
         s.send(command)
 
         time.sleep(3)
 
     for delayTime in double_range(0, 1.5, .25):
-        thisMove = list(center)
         thisMove[0] = center[0] - .1
         thisMove[2] = center[2] - .1
-        command = "movel(p"+str(thisMove)+", a=1.3, v=.3, r="+str(blend)+")" + "\n"
+        command = "movel(p" + POSE_FMT % tuple(thisMove) + fast_suffix
         print command
+        rate_limiter.wait()
         s.send(command)
 
         time.sleep(2)
 
-        thisMove = list(center)
         thisMove[0] = center[0] + .1
         thisMove[2] = center[2] - .1
-        command = "movel(p"+str(thisMove)+", a=.2, v=.1, r="+str(blend)+")" + "\n"
+        command = "movel(p" + POSE_FMT % tuple(thisMove) + slow_suffix
         print command
+        rate_limiter.wait()
         s.send(command)
 
         time.sleep(delayTime)
 
         command = "stopl(a=.2)" + "\n"
         print command
+        rate_limiter.wait()
         s.send(command)
 
         time.sleep(3)
@@ -28,7 +28,6 @@ terminal). Run this script, with commandline args."""
 import argparse
 import cb2_robot
 import json
-import time
 
 
 def main():
@@ -59,9 +58,9 @@ def main():
     print 'read in {} points, written at: {}'.format(len(points.keys()),
                                                      write_time)
     with cb2_robot.URRobot(host, port) as robot:
-        for number in sorted([int(x) for x in points.keys()]):
-            robot.add_goal(cb2_robot.Goal(points[str(number)]['joint'], False,
-                                          'joint'))
+        for number, point in sorted(points.items(),
+                                    key=lambda item: int(item[0])):
+            robot.add_goal(cb2_robot.Goal(point['joint'], False, 'joint'))
             # TODO: this appears to skip the first point!
             robot.move_on_stop()
             print 'Beginning move: {}'.format(number)
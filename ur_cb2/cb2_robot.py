@@ -26,9 +26,8 @@ accessed through the cb2_send and cb2_receive modules."""
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import Queue
+import collections
 import socket
-import time
 
 import send.cb2_send as cb2_send
 import receive.cb2_receive as cb2_receive
@@ -38,8 +37,9 @@ class Goal(object):
     """Holds movement goals
 
     Attributes:
-        pose: A 6 float tuple or list describing the desired robot pose in
-            either joint or cartesian coordinates
+        pose: A 6 float tuple describing the desired robot pose in either
+            joint or cartesian coordinates. It is copied from the pose passed
+            in, so later changes to that list do not affect the goal.
         cartesian: A boolean describing whether the pose is in joint (False) or
             cartesian (True) space
         move_type: A string describing the movement type. Valid values are:
@@ -51,8 +51,19 @@ class Goal(object):
         radius: Float, the blend radius in m for bending moves. Note, a radius
             will result in inaccurate positioning and so the robot will never
             reach its goal.
+        command: String, the URScript command for the move, built once when
+            the goal is created. It is not rebuilt if the other attributes
+            are changed afterwards.
     """
 
+    # Paths can hold many goals, so they do not each carry a __dict__
+    __slots__ = ('pose', 'cartesian', 'move_type', 'velocity',
+                 'acceleration', 'radius', 'command')
+
+    #: The URScript command used for each move type
+    script_commands = {'linear': 'movel', 'joint': 'movej',
+                       'process': 'movep'}
+
     def __init__(self, pose, cartesian, move_type, velocity=0.3,
                  acceleration=1.3, radius=0.0):
         """Create a goal object.
@@ -76,15 +87,23 @@ class Goal(object):
         Raises:
             ValueError: The move type was not a valid value ('linear', 'joint',
                 'process')
+            TypeError: The pose or cartesian were not valid
         """
-        self.pose = pose
+        cb2_send.check_pose(pose)
+        if not isinstance(cartesian, bool):
+            raise TypeError('Cartesian must be a boolean')
+        self.pose = tuple(pose)  # Must match the command built below
         self.cartesian = cartesian
-        if move_type not in ('linear', 'joint', 'process'):
+        if move_type not in self.script_commands:
             raise ValueError('move_type must be: linear, joint or process')
         self.move_type = move_type
         self.velocity = velocity
         self.acceleration = acceleration
         self.radius = radius
+        self.command = '{}({}[{}],a={},v={},r={})'.format(
+            self.script_commands[move_type], 'p' if cartesian else '',
+            cb2_send.clean_list_tuple(self.pose), acceleration, velocity,
+            radius)
 
 
 class URRobot(object):
@@ -103,16 +122,29 @@ class URRobot(object):
         receiver: cb2_receive.URReceiver which receives data from the robot
             on a separate thread
         sender: cb2_send.URSender which sends commands to the robot
+        __moves: Dictionary of the sender's move methods keyed by move type
         error: Float which defines the error around a point from which it is
             acceptable to move to the next point.
-        goals: Queue.Queue of Goal objects defining movement goals
+        goals: collections.deque of Goal objects defining movement goals.
+            Goals are only added and taken by the thread using the URRobot,
+            so a deque is used rather than a locking queue.
         current_goal: Goal, the current movement goal.
+        __closed: Boolean, whether the robot has been closed
     """
-    sleep_time = 0.001
+    #: The idle time and probe interval in seconds, and probe count, used to
+    #: detect a dead connection
+    keepalive_settings = (('TCP_KEEPIDLE', 5), ('TCP_KEEPINTVL', 2),
+                          ('TCP_KEEPCNT', 3))
 
-    def __init__(self, ip, port, verbose=False):
+    def __init__(self, ip, port, verbose=False, socket_options=()):
         """Construct a UR Robot connection to send commands
 
+        Nagle's algorithm is disabled on the socket so that short commands
+        are sent immediately rather than being held for coalescing. TCP
+        keepalive is enabled so that a robot which silently drops off of the
+        network is detected within about ten seconds rather than leaving the
+        receiver blocked forever.
+
         Args:
             ip (str): The IP address to find the Robot
             port (int): The port to connect to on the robot (
@@ -120,27 +152,56 @@ class URRobot(object):
                 3002:secondary client,
                 3003: real time client)
             verbose (bool): Whether to print information to the terminal
+            socket_options (tuple or list of tuples): Additional
+                (level, option, value) tuples to pass to setsockopt once the
+                socket is connected, ex:
+                ((socket.SOL_SOCKET, socket.SO_RCVBUF, 65536),)
         """
         self.__socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.__socket.connect((ip, port))
+        self.__socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.__socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for option, value in self.keepalive_settings:
+            if hasattr(socket, option):  # These are not available everywhere
+                self.__socket.setsockopt(socket.IPPROTO_TCP,
+                                         getattr(socket, option), value)
+        for level, option, value in socket_options:
+            self.__socket.setsockopt(level, option, value)
         self.receiver = cb2_receive.URReceiver(self.__socket, verbose)
         self.sender = cb2_send.URSender(self.__socket, verbose)
+        self.__moves = {'joint': self.sender.move_joint,
+                        'linear': self.sender.move_line,
+                        'process': self.sender.move_process}
         self.error = 0.0
-        self.goals = Queue.Queue()
+        self.goals = collections.deque()
         self.receiver.start()
         self.current_goal = None
+        self.__closed = False
 
     def __del__(self):
         """Destructor for the ur_cb2 class
 
         Specifically, this stops the threads in the receiver.
         """
+        self.close()
+
+    def close(self):
+        """Stops the threads in the receiver and closes the socket.
+
+        Only the first call has any effect, so the robot can be closed by a
+        with statement and again when it is garbage collected.
+        """
+        if self.__closed:
+            return
+        self.__closed = True
         self.receiver.stop()
         self.__socket.close()
 
     def move_on_error(self, multiplier=None):
         """Moves the robot once the robot is within error of the next move.
 
+        The check is repeated as each data set arrives from the robot.
+
         Args:
             multiplier (float): Defines how far the path should be set to
                 overshoot, this can be useful for preventing deceleration
@@ -150,12 +211,12 @@ class URRobot(object):
         """
         if self.error <= self.current_goal.radius:
             raise ValueError('The error value must be greater than the radius')
-        if (not self.goals.empty()) and (self.current_goal is not None):
+        if self.goals and (self.current_goal is not None):
                 while not self.receiver.at_goal(
                         self.current_goal.pose,
                         self.current_goal.cartesian,
                         self.error):
-                    time.sleep(self.sleep_time)
+                    self.receiver.wait_for_data()
                 if multiplier is None:
                     self.move_now()
                 else:
@@ -166,15 +227,16 @@ class URRobot(object):
 
         Note, the robot can be stopped both at the beginning and end of its
         path, therefore, this function also checks whether the robot is at
-        its current goal.
+        its current goal. The check is repeated as each data set arrives from
+        the robot.
         """
-        if not self.goals.empty():
+        if self.goals:
             while not (self.receiver.is_stopped() and (
                        self.current_goal is None or
                        self.receiver.at_goal(self.current_goal.pose,
                                              self.current_goal.cartesian,
                                              0.01))):
-                time.sleep(self.sleep_time)
+                self.receiver.wait_for_data()
             self.move_now()
 
     def add_goal(self, goal):
@@ -188,15 +250,14 @@ class URRobot(object):
         """
         if not isinstance(goal, Goal):
             raise TypeError('Requires the goal be of type Goal')
-        self.goals.put(goal)
+        self.goals.append(goal)
 
     def clear_goals(self):
         """Clears the goal queue.
 
         Allows a user to directly specify the next move.
         """
-        with self.goals.mutex:
-            self.goals.queue.clear()
+        self.goals.clear()
 
     def at_goal(self):
         """Return whether the robot is at the goal
@@ -222,22 +283,31 @@ class URRobot(object):
         125 packets per second. If you call move_now too often, it will queue up
         calls and not move now.
 
+        Without a multiplier, the command prebuilt by the goal is sent as is,
+        and the sender's acceleration, velocity and radius are not changed.
+        A later stop_joint or stop_linear on the sender therefore uses the
+        sender's own acceleration rather than the last goal's.
+
         Args:
             multiplier (float): An optional multiplier on the path goal which
                 will make the robot move past the goal to allow better
                 blending of moves. It is ignored if None.
+
+        Raises:
+            IndexError: There are no goals in the queue
         """
-        self.current_goal = self.goals.get()
-        if multiplier is not None:
-            with self.receiver.lock:
-                current_position = tuple(
-                    self.receiver.position if
-                    self.current_goal.cartesian else
-                    self.receiver.actual_joint_positions)
-            move_goal = cb2_send.scale_path(current_position,
-                                            self.current_goal.pose, multiplier)
-        else:
-            move_goal = self.current_goal.pose
+        self.current_goal = self.goals.popleft()
+        if multiplier is None:
+            self.sender.send(self.current_goal.command)
+            return
+
+        # A single attribute read, the receiver replaces it as a whole
+        current_position = tuple(
+            self.receiver.position if
+            self.current_goal.cartesian else
+            self.receiver.actual_joint_positions)
+        move_goal = cb2_send.scale_path(current_position,
+                                        self.current_goal.pose, multiplier)
         self.sender.radius = self.current_goal.radius
 
         if self.current_goal.move_type == 'joint':
@@ -247,20 +317,35 @@ class URRobot(object):
             self.sender.a_tool = self.current_goal.acceleration
             self.sender.v_tool = self.current_goal.velocity
 
-        if self.current_goal.move_type == 'joint':
-            self.sender.move_joint(move_goal,
-                                   cartesian=self.current_goal.cartesian)
-        if self.current_goal.move_type == 'linear':
-            self.sender.move_line(move_goal,
-                                  cartesian=self.current_goal.cartesian)
-        if self.current_goal.move_type == 'process':
-            self.sender.move_process(move_goal,
-                                     cartesian=self.current_goal.cartesian)
+        self.__moves[self.current_goal.move_type](
+            move_goal, cartesian=self.current_goal.cartesian)
+
+    def move_all(self):
+        """Sends every goal in the queue to the robot as one program.
+
+        Moves sent one at a time replace each other, which is why move_on_stop
+        and move_on_error wait on the robot between goals. Wrapped in a single
+        URScript program, the robot runs the moves in order, blending them by
+        each goal's radius, and the whole program goes out in one write. The
+        path cannot be changed once sent, other than by sending a new move
+        or stop. The last goal sent becomes the current goal.
+
+        Raises:
+            IndexError: There are no goals in the queue
+        """
+        self.current_goal = self.goals.popleft()
+        with self.sender.batch():
+            self.sender.send('def move_all():')
+            self.sender.send('  ' + self.current_goal.command)
+            while self.goals:
+                self.current_goal = self.goals.popleft()
+                self.sender.send('  ' + self.current_goal.command)
+            self.sender.send('end')
 
     def __enter__(self):
         """Enters the URRobot from a with statement"""
         return self
 
     def __exit__(self, *_):
-        """Exits at the end of a context manager statement by destructing."""
-        self.__del__()
+        """Exits at the end of a context manager statement by closing."""
+        self.close()
@@ -59,7 +59,7 @@ def main():
         robot.add_goal(cb2_robot.Goal(thisMove, True, 'linear'))
 
         # robot.move_now()
-        while not robot.goals.empty():
+        while robot.goals:
             robot.move_on_stop()
         print 'complete loop 1'
 
@@ -72,7 +72,7 @@ def main():
             thisMove[2] = center[2] + random.uniform(-.2, .2)
             robot.add_goal(cb2_robot.Goal(thisMove, True, 'linear'))
 
-        while not robot.goals.empty():
+        while robot.goals:
             robot.move_on_stop()
         print 'complete loop 2'
 
@@ -23,10 +23,15 @@
 # SOFTWARE.
 
 
+import binascii
+import errno
+import operator
 import socket
 import struct
-import array
+import sys
 import threading
+import time
+from itertools import imap
 
 
 class URReceiver(object):
@@ -45,9 +50,11 @@ class URReceiver(object):
     paradigm.
 
     Attributes:
-        clean_data: Double array of length 101 for all of the data returned by
-            the robot
-        raw_data: String of complete raw data packet
+        clean_data: Tuple of the 102 values in the newest data set returned
+            by the robot, starting with the packet length. It is replaced as
+            a whole for each data set, so a single read of it is a consistent
+            snapshot without the lock
+        raw_data: Bytearray of the newest complete raw data packet
         __socket: The socket for communications
         clean_packets: The Integer number of packets which have been received
             cleanly
@@ -55,7 +62,16 @@ class URReceiver(object):
             as stubs
         received: The total Integer number of complete data sets which have
             been received
-        waiting_data: String to hold incomplete data sets
+        skipped_packets: The Integer number of complete data sets which were
+            discarded because a newer data set was already waiting
+        waiting_data: Preallocated 812 member bytearray which data sets are
+            received into
+        waiting_length: The Integer number of bytes of the current data set
+            which are in waiting_data
+        __waiting_view: A memoryview of waiting_data to receive into
+        __spare_data: Preallocated 812 member bytearray which becomes
+            waiting_data once the current data set is complete. waiting_data,
+            raw_data and __spare_data are rotated rather than copied
         new_data: Boolean whether new data is available for processing
         time: Double of time elapsed since the controller was started
         target_joint_positions: 6 member Double list of target joint positions
@@ -90,6 +106,11 @@ class URReceiver(object):
         run: Boolean on whether to run or not
         __receiving_thread: Thread object for running the receiving and parsing
             loops
+        __printing_thread: Thread object for printing data when verbose
+        __decoded: threading.Event set each time a data set is decoded
+        __data_condition: threading.Condition notified each time the
+            receiving thread decodes a data set, and when it exits
+        __receiving: Boolean, whether the receiving thread is running
         verbose: Boolean defining whether or not to print data
         lock: A threading lock which is used to protect data from race
             conditions
@@ -112,6 +133,50 @@ class URReceiver(object):
     #: The precision for printing data
     precision = 7
     double_format_string = "{:+0"+str(precision+4)+"."+str(precision)+"f}"
+    #: The format string for the name column when printing
+    name_format_string = "%-"+str(name_width)+"s"
+    #: Formats a double for printing, bound once rather than on every call
+    format_double = double_format_string.format
+    #: The locations in clean_data of fields which are checked without the
+    #: lock by reading clean_data once
+    target_joint_velocities_slice = slice(8, 14)
+    actual_joint_positions_slice = slice(32, 38)
+    actual_joint_velocities_slice = slice(38, 44)
+    position_slice = slice(74, 80)
+    #: The names and attributes of the fields printed by print_parsed_data
+    printed_fields = (
+        ("Time since controller turn on", 'time'),
+        ("Target joint positions", 'target_joint_positions'),
+        ("Target joint velocities", 'target_joint_velocities'),
+        ("Target joint accelerations", 'target_joint_accelerations'),
+        ("Target joint currents", 'target_joint_currents'),
+        ("Target joint moments (torque)", 'target_joint_moments'),
+        ("Actual joint positions", 'actual_joint_positions'),
+        ("Actual joint velocities", 'actual_joint_velocities'),
+        ("Actual joint currents", 'actual_joint_currents'),
+        ("Tool accelerometer values", 'tool_accelerometer'),
+        ("Generalised forces in the TCP", 'force_tcp'),
+        ("Cartesian tool position", 'position'),
+        ("Cartesian tool speed", 'tool_speed'),
+        ("Joint temperatures (deg C)", 'joint_temperature'),
+        ("Controller period", 'controller_period'),
+        ("Robot control mode", 'robot_control_mode'),
+        ("Joint control modes", 'joint_control_modes'))
+    #: The printed numbers of the 18 digital inputs
+    digital_input_numbers = ((name_format_string % "Digital Input Number") +
+                             ": " + '|'.join('{:^2d}'.format(x)
+                                             for x in range(0, 18)))
+    #: The printed cells for each value of a byte of the digital inputs
+    digital_input_cells = ['|'.join('{:^2s}'.format(x)
+                                    for x in '{:08b}'.format(i)[::-1])
+                           for i in range(256)]
+    #: The flag to block until all requested data has been received, zero
+    #: where unsupported
+    wait_all_flag = getattr(socket, 'MSG_WAITALL', 0)
+    #: The flag for a single non-blocking receive, zero where unsupported
+    dont_wait_flag = getattr(socket, 'MSG_DONTWAIT', 0)
+    #: The minimum time in seconds between prints of the parsed data
+    print_period = 0.1
 
     def __init__(self, open_socket, verbose=False):
         """Construct a UR Robot connection given connection parameters
@@ -120,13 +185,18 @@ class URReceiver(object):
             open_socket (socket.socket): The socket to use for communications.
             verbose (bool): Whether to print received data in main loop
         """
-        self.clean_data = array.array('d', [0] * 101)
-        self.raw_data = ''
+        self.raw_data = bytearray(812)
+        # Decoding the zeroed packet gives clean_data its final shape
+        self.clean_data = self.format.unpack_from(self.raw_data)
         self.__socket = open_socket
         self.clean_packets = 0
         self.stub_packets = 0
         self.received = 0
-        self.waiting_data = ''
+        self.skipped_packets = 0
+        self.waiting_data = bytearray(812)
+        self.waiting_length = 0
+        self.__waiting_view = memoryview(self.waiting_data)
+        self.__spare_data = bytearray(812)
         self.new_data = False
         self.time = 0.0
         self.target_joint_positions = [0.0]*6
@@ -148,6 +218,10 @@ class URReceiver(object):
         self.joint_control_modes = [0.0]*6
         self.run = False
         self.__receiving_thread = None
+        self.__printing_thread = None
+        self.__decoded = threading.Event()
+        self.__data_condition = threading.Condition()
+        self.__receiving = False
         self.verbose = verbose
         self.lock = threading.Lock()
         self._is_stopped = False
@@ -161,73 +235,180 @@ class URReceiver(object):
         print "Received: "+str(self.received) + " data sets"
         print "Received: "+str(self.clean_packets) + " clean packets"
         print "Received: "+str(self.stub_packets) + " stub packets"
+        print "Skipped: "+str(self.skipped_packets) + " stale data sets"
 
     def decode(self):
         """Decode the data stored in the class's rawData field.
 
         Only process the data if there is new data available. Unset the
-        self.newData flag upon completion. Note, this will lock the data set
-        and block execution in a number of other functions
+        self.newData flag upon completion. The packet is unpacked before the
+        lock is taken, so the lock is only held while the fields are updated.
+        Note, this will lock the data set and block execution in a number of
+        other functions
         """
-        with self.lock:
-            if self.new_data:
-                self.clean_data = self.format.unpack(self.raw_data)
-                self.time = self.clean_data[1]
-                self.target_joint_positions = self.clean_data[2:8]
-                self.target_joint_velocities = self.clean_data[8:14]
-                self.target_joint_accelerations = self.clean_data[14:20]
-                self.target_joint_currents = self.clean_data[20:26]
-                self.target_joint_moments = self.clean_data[26:32]
-                self.actual_joint_positions = self.clean_data[32:38]
-                self.actual_joint_velocities = self.clean_data[38:44]
-                self.actual_joint_currents = self.clean_data[44:50]
-                self.tool_accelerometer = self.clean_data[50:53]
-                # unused = self.clean_data[53:68]
-                self.force_tcp = self.clean_data[68:74]
-                self.position = self.clean_data[74:80]
-                self.tool_speed = self.clean_data[80:86]
-                self.digital_inputs = self.clean_data[86]
-                self.joint_temperature = self.clean_data[87:93]
-                self.controller_period = self.clean_data[93]
-                # test value = self.clean_data[94]
-                self.robot_control_mode = self.clean_data[95]
-                self.joint_control_modes = self.clean_data[96:102]
+        if self.new_data:
+            # raw_data is only written by receive(), which runs on this thread
+            clean_data = self.format.unpack_from(self.raw_data)
+            with self.lock:
+                self.clean_data = clean_data
+                self.time = clean_data[1]
+                self.target_joint_positions = clean_data[2:8]
+                self.target_joint_velocities = clean_data[
+                    self.target_joint_velocities_slice]
+                self.target_joint_accelerations = clean_data[14:20]
+                self.target_joint_currents = clean_data[20:26]
+                self.target_joint_moments = clean_data[26:32]
+                self.actual_joint_positions = clean_data[
+                    self.actual_joint_positions_slice]
+                self.actual_joint_velocities = clean_data[
+                    self.actual_joint_velocities_slice]
+                self.actual_joint_currents = clean_data[44:50]
+                self.tool_accelerometer = clean_data[50:53]
+                # unused = clean_data[53:68]
+                self.force_tcp = clean_data[68:74]
+                self.position = clean_data[self.position_slice]
+                self.tool_speed = clean_data[80:86]
+                self.digital_inputs = clean_data[86]
+                self.joint_temperature = clean_data[87:93]
+                self.controller_period = clean_data[93]
+                # test value = clean_data[94]
+                self.robot_control_mode = clean_data[95]
+                self.joint_control_modes = clean_data[96:102]
                 self.new_data = False
         self._is_stopped = self.is_stopped()
 
     def receive(self):
         """Receive data from the UR Robot.
 
-        If an entire data set is not received, then store the data in a
-        temporary location (self.waitingData). Once a complete packet is
-        received, place the complete packet into self.rawData and set the
-        newData flag. Note, this will lock the data set and block execution in a
-        number of other functions once a full data set is built.
+        Data is received directly into a preallocated buffer
+        (self.waiting_data) until an entire data set has been received. Where
+        the platform supports MSG_WAITALL, this is normally a single read,
+        otherwise short reads, and reads interrupted by a signal, are repeated
+        until the data set is complete. Once a complete packet is received,
+        any further complete packets which are already waiting on the socket
+        are read with MSG_DONTWAIT and only the newest one is kept, so a slow
+        consumer never works from stale data. Waiting packets are not drained
+        if the socket has a timeout or the platform lacks MSG_DONTWAIT.
+        The newest packet is placed into self.rawData and the newData flag is
+        set. Note, this will lock the data set and block execution in a number
+        of other functions once a full data set is built.
+
+        Raises:
+            socket.error: The robot closed the connection
+            ValueError: The length field of the packet was not 812, the robot
+                is running software which sends a different packet format
         """
-        incoming_data = self.__socket.recv(812)  # expect to get 812 bytes
-        if len(incoming_data) == 812:
+        while self.waiting_length < 812:
+            try:
+                received = self.__receive_into(self.wait_all_flag)
+            except socket.error as e:
+                if e.errno == errno.EINTR:  # Interrupted by a signal, retry
+                    continue
+                raise
+            if not received:
+                raise socket.error('The connection was closed by the robot')
+
+        packet = self.__drain()
+        length = self.formatLength.unpack_from(packet)[0]
+        if length != 812:
+            raise ValueError('Expected 812 byte packets, the robot sent a {} '
+                             'byte packet'.format(length))
+        with self.lock:
+            self.__spare_data, self.raw_data = self.raw_data, packet
+        self.new_data = True
+
+    def __receive_into(self, flags):
+        """Receive the rest of the current data set into self.waiting_data.
+
+        Never reads past the end of the current data set, so that data sets
+        stay aligned with the buffer.
+
+        Args:
+            flags (int): Flags to pass to the socket's recv_into
+
+        Returns: The Integer number of bytes received, zero if the connection
+            was closed
+        """
+        # Only slice the view, which allocates, when resuming a partial read
+        received = self.__socket.recv_into(
+            self.__waiting_view[self.waiting_length:] if self.waiting_length
+            else self.__waiting_view,
+            812 - self.waiting_length, flags)
+        if received == 812:
             self.clean_packets += 1
-        else:
+        elif received:
             self.stub_packets += 1
-        if self.formatLength.unpack(incoming_data[0:4])[0] == 812:
-            self.waiting_data = incoming_data
-        else:
-            self.waiting_data += incoming_data
+        self.waiting_length += received
+        return received
 
-        if len(self.waiting_data) == 812:
-            with self.lock:
-                self.raw_data = self.waiting_data
-            self.received += 1
-            self.new_data = True
+    def __swap_waiting(self, buffer_data):
+        """Start receiving a new data set into buffer_data.
+
+        Args:
+            buffer_data (bytearray): The 812 member buffer to receive into
+
+        Returns: Bytearray which was being received into
+        """
+        previous = self.waiting_data
+        self.waiting_data = buffer_data
+        self.__waiting_view = memoryview(buffer_data)
+        self.waiting_length = 0
+        return previous
+
+    def __drain(self):
+        """Take the complete data set and any newer ones waiting on the socket.
+
+        Reads from the socket with MSG_DONTWAIT until no more data is
+        available. A trailing incomplete data set is left in
+        self.waiting_data. The socket's blocking mode is never changed, as it
+        may be shared with a URSender sending from another thread, so the
+        complete data set is returned as is when MSG_DONTWAIT is not
+        available or the socket has a timeout.
+
+        Returns: Bytearray of the newest complete data set
+        """
+        packet = self.__swap_waiting(self.__spare_data)
+        self.received += 1
+        # A socket with a timeout waits in select before reading, whatever
+        # the flags are
+        if self.dont_wait_flag and self.__socket.gettimeout() is None:
+            return self.__drain_available(packet)
+        return packet
+
+    def __drain_available(self, packet):
+        """Receive data sets until the socket has no more data available.
+
+        Each read is made non-blocking with MSG_DONTWAIT.
+
+        Args:
+            packet (bytearray): The newest complete data set
+
+        Returns: Bytearray of the newest complete data set
+        """
+        while True:
+            try:
+                if not self.__receive_into(self.dont_wait_flag):
+                    break
+            except socket.error as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+            if self.waiting_length == 812:
+                packet = self.__swap_waiting(packet)
+                self.received += 1
+                self.skipped_packets += 1
+        return packet
 
     def print_raw_data(self):
-        """Print the raw data which is stored in self.raw_data.
+        """Print the raw data which is stored in self.raw_data as hex.
 
-        Note, this will lock the data set and block execution in a number of
-        other functions
+        The packet is mostly binary doubles, so it is printed as hex rather
+        than as raw bytes. Note, this will lock the data set and block
+        execution in a number of other functions while the hex is made
         """
         with self.lock:
-            print "Received (raw): "+self.raw_data + "\n"
+            raw_hex = binascii.hexlify(self.raw_data)
+        print "Received (raw): " + raw_hex + "\n"
 
     def print_data(self):
         """Print the processed data stored in self.clean_data
@@ -240,8 +421,8 @@ class URReceiver(object):
             print self.clean_data
             print "\n"
 
-    def output_data_item(self, name, values):
-        """Output item with name and values.
+    def format_data_item(self, name, values):
+        """Format item with name and values.
 
         Formatting is specified by self.name_width and self.precision.
 
@@ -249,97 +430,145 @@ class URReceiver(object):
             name (str): The name of the value
             values (float, int, tuple of float, list of float): The list of
                 values
+
+        Returns: String of the formatted item
         """
-        to_print = ("%-"+str(self.name_width)+"s") % name
+        to_print = self.name_format_string % name
         if isinstance(values, (list, tuple)):
-            to_print += ": [%s]" % ', '.join(self.double_format_string.format(x)
-                                             for x in values)
+            to_print += ": [%s]" % ', '.join(map(self.format_double, values))
         elif isinstance(values, (int, bool)):
             to_print += ": [%s]" % str(values)
         elif isinstance(values, float):
-            to_print += ": [%s]" % self.double_format_string.format(values)
+            to_print += ": [%s]" % self.format_double(values)
         else:
-            print "I don't know that data type: " + str(type(values))
-        print to_print
+            to_print += ": I don't know that data type: " + str(type(values))
+        return to_print
+
+    def format_digital_inputs(self, digital_inputs):
+        """Format the 18 digital inputs as cells, lowest input first.
+
+        Args:
+            digital_inputs (int): The bit encoded digital inputs
+
+        Returns: String of the formatted digital inputs
+        """
+        cells = self.digital_input_cells
+        return '|'.join((cells[digital_inputs & 0xFF],
+                         cells[(digital_inputs >> 8) & 0xFF],
+                         cells[(digital_inputs >> 16) & 0x03][:5]))
+
+    def output_data_item(self, name, values):
+        """Output item with name and values.
+
+        Formatting is specified by self.name_width and self.precision.
+
+        Args:
+            name (str): The name of the value
+            values (float, int, tuple of float, list of float): The list of
+                values
+        """
+        print self.format_data_item(name, values)
 
     def print_parsed_data(self):
         """Print the parsed data
 
+        The output is built up and written to the terminal in a single write.
         Note, this will lock the data set and block execution in a number of
         other functions
         """
         with self.lock:
-            print "\033[H"
-            self.output_data_item("Time since controller turn on",
-                                  self.time)
-            self.output_data_item("Target joint positions",
-                                  self.target_joint_positions)
-            self.output_data_item("Target joint velocities",
-                                  self.target_joint_velocities)
-            self.output_data_item("Target joint accelerations",
-                                  self.target_joint_accelerations)
-            self.output_data_item("Target joint currents",
-                                  self.target_joint_currents)
-            self.output_data_item("Target joint moments (torque)",
-                                  self.target_joint_moments)
-            self.output_data_item("Actual joint positions",
-                                  self.actual_joint_positions)
-            self.output_data_item("Actual joint velocities",
-                                  self.actual_joint_velocities)
-            self.output_data_item("Actual joint currents",
-                                  self.actual_joint_currents)
-            self.output_data_item("Tool accelerometer values",
-                                  self.tool_accelerometer)
-            self.output_data_item("Generalised forces in the TCP",
-                                  self.force_tcp)
-            self.output_data_item("Cartesian tool position",
-                                  self.position)
-            self.output_data_item("Cartesian tool speed",
-                                  self.tool_speed)
-            self.output_data_item("Joint temperatures (deg C)",
-                                  self.joint_temperature)
-            self.output_data_item("Controller period",
-                                  self.controller_period)
-            self.output_data_item("Robot control mode",
-                                  self.robot_control_mode)
-            self.output_data_item("Joint control modes",
-                                  self.joint_control_modes)
-            print ((("%-"+str(self.name_width)+"s") % "Digital Input Number") +
-                   ": " + '|'.join('{:^2d}'.format(x) for x in range(0, 18)))
-            print ((("%-"+str(self.name_width)+"s") % "Digital Input Value: ") +
-                   ": " + '|'.join('{:^2s}'.format(x) for x in '{:018b}'.format(
-                    self.digital_inputs)[::-1]))
-            self.output_data_item("Is Stopped:",
-                                  self._is_stopped)
+            lines = ["\033[H"]
+            lines.extend(self.format_data_item(name, getattr(self, attribute))
+                         for name, attribute in self.printed_fields)
+            lines.append(self.digital_input_numbers)
+            lines.append((self.name_format_string % "Digital Input Value: ") +
+                         ": " + self.format_digital_inputs(self.digital_inputs))
+            lines.append(self.format_data_item("Is Stopped:",
+                                               self._is_stopped))
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
 
     def start(self):
-        """Spawn a new thread for receiving and run it"""
+        """Spawn new threads for receiving and printing and run them
+
+        The printing thread is only spawned if verbose is set.
+        """
         if (self.__receiving_thread is None or
                 not self.__receiving_thread.is_alive()):
             self.run = True
+            self.__receiving = True
             self.__receiving_thread = threading.Thread(group=None,
                                                        target=self.loop,
                                                        name='receiving_thread',
                                                        args=(),
                                                        kwargs={})
             self.__receiving_thread.start()
+        if self.verbose and (self.__printing_thread is None or
+                             not self.__printing_thread.is_alive()):
+            self.__printing_thread = threading.Thread(group=None,
+                                                      target=self.print_loop,
+                                                      name='printing_thread',
+                                                      args=(),
+                                                      kwargs={})
+            self.__printing_thread.daemon = True
+            self.__printing_thread.start()
 
     def loop(self):
-        """The main loop which receives, decodes, and optionally prints data"""
+        """The main loop which receives and decodes data
+
+        Signals the printing thread and any threads in wait_for_data() each
+        time a data set is decoded. If receiving fails, self.run is cleared
+        so that the printing thread stops as well.
+        """
+        try:
+            while self.run:
+                self.receive()
+                self.decode()
+                self.__decoded.set()
+                with self.__data_condition:
+                    self.__data_condition.notify_all()
+        finally:
+            self.run = False  # Let the printing thread exit too
+            with self.__data_condition:
+                self.__receiving = False
+                self.__data_condition.notify_all()
+
+    def wait_for_data(self):
+        """Block until the receiving thread decodes the next data set.
+
+        This lets a caller react to each new data set as it arrives, rather
+        than polling.
+
+        Raises:
+            RuntimeError: The receiving thread is not running
+        """
+        with self.__data_condition:
+            if not self.__receiving:
+                raise RuntimeError('The receiving thread is not running')
+            self.__data_condition.wait()
+
+    def print_loop(self):
+        """Print newly decoded data, at most once every self.print_period
+
+        Printing is kept off of the receiving thread so that a slow terminal
+        cannot hold up the socket.
+        """
         while self.run:
-            self.receive()
-            self.decode()
-            if self.verbose:
+            if self.__decoded.wait(self.print_period):
+                self.__decoded.clear()
                 self.print_parsed_data()
+                time.sleep(self.print_period)
 
     def stop(self):
-        """Stops execution of the auxiliary receiving thread"""
+        """Stops execution of the auxiliary receiving and printing threads"""
         if self.__receiving_thread is not None:
             if self.__receiving_thread.is_alive():
                 self.verbose_print('attempting to shutdown auxiliary thread',
                                    '*')
                 self.run = False  # Python writes like this are atomic
                 self.__receiving_thread.join()
+                if self.__printing_thread is not None:
+                    self.__printing_thread.join()
                 self.verbose_print('\033[500D')
                 self.verbose_print('\033[500C')
                 self.verbose_print('-', '-', 40)
@@ -349,6 +578,9 @@ class URReceiver(object):
                 else:
                     self.verbose_print('shutdown auxiliary thread', '*')
             else:
+                self.run = False
+                if self.__printing_thread is not None:
+                    self.__printing_thread.join()
                 self.verbose_print('auxiliary thread already shutdown', '*')
         else:
             self.verbose_print('no auxiliary threads exist', '*')
@@ -372,20 +604,20 @@ class URReceiver(object):
     def is_stopped(self, error=0.005):
         """Check whether the robot is stopped.
 
-        Check whether the joint velocities are all below some error. Note, this
-        will lock the data set and block execution in a number of other
-        functions
+        Check whether the target joint velocities are all zero and the
+        magnitudes of the actual joint velocities are all below some error.
+        This does not take the lock, the velocities are read from a single
+        snapshot of clean_data.
 
         Args:
             error (float): The error range to define "stopped"
 
         Returns: Boolean, whether the robot is stopped.
         """
-        with self.lock:
-            to_return = (
-                all(v == 0 for v in self.target_joint_velocities) and
-                all(v < error for v in self.actual_joint_velocities))
-        return to_return
+        data = self.clean_data
+        return (not any(data[self.target_joint_velocities_slice]) and
+                max(map(abs, data[self.actual_joint_velocities_slice])) <
+                error)
 
     def at_goal(self, goal, cartesian, error=0.005):
         """Check whether the robot is at a goal point.
@@ -394,8 +626,8 @@ class URReceiver(object):
         coordinates are all below some error. This can be used to
         determine if a move has been completed. It can also be used to
         create blends by beginning the next move prior to the current one
-        reaching its goal. Note, this will lock the data set and block execution
-        in a number of other functions.
+        reaching its goal. This does not take the lock, the position is read
+        from a single snapshot of clean_data.
 
         Args:
             goal (6 member tuple or list of floats): The goal to check against
@@ -407,14 +639,16 @@ class URReceiver(object):
 
         Returns: Boolean, whether the current position is within the error
             range of the goal.
+
+        Raises:
+            TypeError: The goal did not have 6 members
         """
-        with self.lock:
-            to_return = (
-                all(abs(g-a) < error for g, a in zip(self.position, goal))
-                if cartesian else
-                all(abs(g-a) < error for g, a in
-                    zip(self.actual_joint_positions, goal)))
-        return to_return
+        if len(goal) != 6:
+            raise TypeError("Expected 6 members in goal")
+        data = self.clean_data
+        current = (data[self.position_slice] if cartesian else
+                   data[self.actual_joint_positions_slice])
+        return max(imap(abs, imap(operator.sub, current, goal))) < error
 
     def __enter__(self):
         """Enters the URRobot receiver from a with statement"""
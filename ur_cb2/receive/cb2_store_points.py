@@ -72,6 +72,7 @@ def main():
     with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM))\
             as robot_socket:
         robot_socket.connect((host, port))
+        robot_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         with cb2_receive.URReceiver(robot_socket, False) as my_ur_receiver:
             my_ur_receiver.start()
             run = True
@@ -22,7 +22,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import socket
+import math
+from contextlib import contextmanager
 
 
 def deg_2_rad(x):
@@ -34,7 +35,7 @@ def deg_2_rad(x):
     Returns: A float of the value input converted to radians
 
     """
-    return 3.14 * x / 180
+    return math.radians(x)
 
 
 def rad_2_deg(x):
@@ -46,12 +47,15 @@ def rad_2_deg(x):
     Returns: A float of the value input converted to degrees.
 
     """
-    return (x / 3.14) * 180
+    return math.degrees(x)
 
 
 def double_range(start, stop, step):
     """ Create a list from start to stop with interval step
 
+    Each value is computed from start rather than by adding step to the last
+    value, so rounding error does not build up over long ranges.
+
     Args:
         start (float): The initial value
         stop (float): The ending value
@@ -59,10 +63,12 @@ def double_range(start, stop, step):
 
     Returns: A list from start to stop with interval step
     """
+    i = 0
     r = start
     while r < stop:
         yield r
-        r += step
+        i += 1
+        r = start + i * step
 
 
 def scale_path(origin, goal, multiplier=2):
@@ -80,11 +86,7 @@ def scale_path(origin, goal, multiplier=2):
     Returns:
         tuple of 6 floats: the new pose along the path.
     """
-    output = []
-    for x, y in zip(origin, goal):
-        output.append(x + (multiplier * (y - x)))
-
-    return tuple(output)
+    return tuple([x + (multiplier * (y - x)) for x, y in zip(origin, goal)])
 
 
 def check_pose(pose):
@@ -101,10 +103,11 @@ def check_pose(pose):
     """
     if not isinstance(pose, (tuple, list)):
         raise TypeError("Expected tuple or list for pose")
-    if not all([isinstance(x, float) for x in pose]):
-        raise TypeError("Expected floats in pose")
     if not len(pose) == 6:
         raise TypeError("Expected 6 members in pose")
+    for x in pose:
+        if not isinstance(x, float):
+            raise TypeError("Expected floats in pose")
 
 
 def check_xyz(pose):
@@ -121,10 +124,11 @@ def check_xyz(pose):
     """
     if not isinstance(pose, (tuple, list)):
         raise TypeError("Expected tuple or list for pose")
-    if not all([isinstance(x, float) for x in pose]):
-        raise TypeError("Expected floats in pose")
     if not len(pose) == 3:
         raise TypeError("Expected 3 members in pose")
+    for x in pose:
+        if not isinstance(x, float):
+            raise TypeError("Expected floats in pose")
 
 
 def clean_list_tuple(input_data):
@@ -166,6 +170,8 @@ class URSender(object):
         force_settings: Tuple of values to set force following settings on robot
         verbose: Boolean of whether to print info to the console
         sent: Integer of the number of commands sent
+        __pending: List of commands waiting to be sent together, None when
+            commands are not being batched
     """
 
     def __init__(self, open_socket, verbose=False):
@@ -188,6 +194,7 @@ class URSender(object):
         self.force_settings = None
         self.verbose = verbose
         self.sent = 0
+        self.__pending = None
 
     def __del__(self):
         """Destructor which prints the number of commands which were sent"""
@@ -196,15 +203,54 @@ class URSender(object):
     def send(self, message):
         """Sends the message over the IP pipe.
 
+        The whole message is always written, even if the socket only takes
+        part of it at a time. If commands are being batched, the message is
+        held until the batch is complete.
+
         Args:
             message (str): The message to be sent.
         """
         message += '\n'
         if self.verbose:
             print message
-        self.__socket.send(message)
+        if self.__pending is not None:
+            self.__pending.append(message)
+        else:
+            self.__socket.sendall(message)
         self.sent += 1
 
+    @contextmanager
+    def batch(self):
+        """Send all commands issued within a with statement in one write.
+
+        This saves a system call and a TCP segment per command when several
+        setup commands are sent back to back, ex::
+
+            with sender.batch():
+                sender.set_tcp(tcp)
+                sender.set_payload(mass)
+
+        Loose motion commands should not be batched, the robot does not
+        buffer motions, so each move replaces the one before it. Moves
+        wrapped in a def ... end program, as URRobot.move_all sends them, run
+        in order and can be batched. If the with statement raises, none of
+        the batched commands are sent.
+        """
+        if self.__pending is not None:  # Already batching
+            yield self
+            return
+        self.__pending = []
+        try:
+            yield self
+        except:
+            self.sent -= len(self.__pending)
+            self.__pending = None
+            raise
+        else:
+            pending, self.__pending = self.__pending, None
+            if pending:
+                self.__socket.sendall(''.join(pending))
+
     def set_force_mode(self, task_frame, selection_vector, wrench, frame_type,
                        limits):
         """Set robot to be controlled in force mode
@@ -279,7 +325,12 @@ class URSender(object):
         if self.force_settings is None:
             raise StandardError('Force Settings have not been set with '
                                 'set_force_mode')
-        self.send('forcemode({},{},{},{},{})'.format(*self.force_settings))
+        task_frame, selection_vector, wrench, frame_type, limits = \
+            self.force_settings
+        self.send('force_mode(p[{}],[{}],[{}],{},[{}])'.format(
+            clean_list_tuple(task_frame),
+            ','.join(['1' if x else '0' for x in selection_vector]),
+            clean_list_tuple(wrench), frame_type, clean_list_tuple(limits)))
 
     def force_mode_off(self):
         """Deactivates force mode"""
@@ -308,7 +359,7 @@ class URSender(object):
         if not isinstance(cartesian, bool):
             raise TypeError('Cartesian must be a boolean')
         point = 'p' if cartesian else ''
-        self.send('movec({}[{}],{}[{}],a={},v={},r={}'.format(
+        self.send('movec({}[{}],{}[{}],a={},v={},r={})'.format(
             point, clean_list_tuple(pose_via), point, clean_list_tuple(
                 pose_to), self.a_tool, self.v_tool, self.radius))
 
@@ -627,18 +678,58 @@ class URSender(object):
                 this call
             IndexError: do_id was out of range (0-9)
         """
+        self.__check_digital_out(do_id, level)
+        self.send('set_digital_out({},{})'.format(do_id, 1 if level else 0))
+
+    def set_digital_outs(self, levels):
+        """Set the values for several digital outputs in one write.
+
+        The outputs are set in order of their IDs, with the commands batched
+        so that they are sent to the robot together. Every ID and level is
+        checked before anything is sent, so no outputs are set if any are
+        not valid.
+
+        Args:
+            levels (dict): Boolean levels keyed by digital output #, see
+                set_digital_out
+
+        Raises:
+            TypeError: An ID was not an integer or a level was not a boolean
+            StandardError: The tool voltage was not set prior to attempting
+                to set a tool flange output
+            IndexError: An ID was out of range (0-9)
+        """
+        outputs = sorted(levels.items())
+        for do_id, level in outputs:
+            self.__check_digital_out(do_id, level)
+        with self.batch():
+            for do_id, level in outputs:
+                self.send('set_digital_out({},{})'.format(do_id,
+                                                          1 if level else 0))
+
+    def __check_digital_out(self, do_id, level):
+        """Checks that a digital output can be set to a level.
+
+        Args:
+            do_id (int): The digital output #, see set_digital_out
+            level (bool): High or low setting for output
+
+        Raises:
+            TypeError: do_id was not an integer or level was not a boolean
+            StandardError: The tool voltage was not set prior to attempting
+                to set a tool flange output
+            IndexError: do_id was out of range (0-9)
+        """
         if not isinstance(do_id, int):
             raise TypeError("Expected int for do_id")
-        if do_id in (8, 9) and not self.tool_voltage_set:
+        if not 0 <= do_id <= 9:
+            raise IndexError("The valid range for digital outputs is 0-9")
+        if do_id > 7 and not self.tool_voltage_set:
             raise StandardError("The tool voltage must be set prior to "
                                 "attempting to alter tool outputs")
-        if do_id > 9 or do_id < 0:
-            raise IndexError("The valid range for digital outputs is 0-9")
         if not isinstance(level, bool):
             raise TypeError("Expected boolean for level")
 
-        self.send('set_digital_out({},{})'.format(do_id, 1 if level else 0))
-
     def set_tool_voltage(self, voltage):
         """Sets the voltage level for the power supply that delivers power to
         the connector plug in the tool flange of the robot. The voltage can
@@ -32,6 +32,7 @@ def main():
     PORT = 30003              # The same port as used by the server
     robot_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     robot_socket.connect((HOST, PORT))
+    robot_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
     robot = cb2_send.URSender(robot_socket, True)
 